@@ -45,6 +45,8 @@ Flow Meter Interfaces
 Orifice Plate Correlations
 --------------------------
 .. autofunction:: C_Reader_Harris_Gallagher
+.. autoclass:: ReaderHarrisGallagherOrifice
+    :members: C
 .. autofunction:: C_eccentric_orifice_ISO_15377_1998
 .. autofunction:: C_quarter_circle_orifice_ISO_15377_1998
 .. autofunction:: C_Miller_1996
@@ -94,12 +96,15 @@ Flow Meter Utilities
 """
 
 from __future__ import division
+from bisect import bisect_right
 from math import acos, exp, log, log10, pi, sqrt
 from fluids.core import Froude_densimetric
 from fluids.numerics import bisplev, brenth, implementation_optimize_tck, interp, secant
-from fluids.constants import inch, inch_inv, pi_inv, root_two
+from fluids.constants import inch, inch_inv, pi_inv
 
-__all__ = ['C_Reader_Harris_Gallagher',
+_quarter_pi = 0.25*pi
+
+__all__ = ['C_Reader_Harris_Gallagher', 'ReaderHarrisGallagherOrifice',
            'differential_pressure_meter_solver',
            'differential_pressure_meter_dP',
            'flow_meter_discharge', 'orifice_expansibility',
@@ -251,7 +256,7 @@ def flow_meter_discharge(D, Do, P1, P2, rho, C, expansibility=1.0):
     '''
     beta = Do/D
     beta2 = beta*beta
-    return (0.25*pi*Do*Do)*C*expansibility*sqrt((2.0*rho*(P1 - P2))/(1.0 - beta2*beta2))
+    return (_quarter_pi*Do*Do)*C*expansibility*sqrt((2.0*rho*(P1 - P2))/(1.0 - beta2*beta2))
 
 
 def orifice_expansibility(D, Do, P1, P2, k):
@@ -374,7 +379,9 @@ def orifice_expansibility_1989(D, Do, P1, P2, k):
     .. [2] Miller, Richard W. Flow Measurement Engineering Handbook. 3rd
        edition. New York: McGraw-Hill Education, 1996.
     '''
-    return 1.0 - (0.41 + 0.35*(Do/D)**4)*(P1 - P2)/(k*P1)
+    beta = Do/D
+    beta2 = beta*beta
+    return 1.0 - (0.41 + 0.35*beta2*beta2)*(P1 - P2)/(k*P1)
 
 
 def C_Reader_Harris_Gallagher(D, Do, rho, mu, m, taps='corner'):
@@ -493,12 +500,19 @@ def C_Reader_Harris_Gallagher(D, Do, rho, mu, m, taps='corner'):
     .. [4] Reader-Harris, Michael. Orifice Plates and Venturi Tubes. Springer,
        2015.
     '''
-    A_pipe = 0.25*pi*D*D
-    v = m/(A_pipe*rho)
-    Re_D = rho*v*D/mu
-    Re_D_inv = 1.0/Re_D
+    # rho cancels out of Re_D = rho*v*D/mu with v = m/(A_pipe*rho)
+    A_pipe = _quarter_pi*D*D
+    Re_D = m*D/(A_pipe*mu)
 
-    beta = Do/D
+    if taps == 'corner':
+        return _C_Reader_Harris_Gallagher_corner(D, Do, Re_D)
+    elif taps == 'D' or taps == 'D/2' or taps == ORIFICE_D_AND_D_2_TAPS:
+        return _C_Reader_Harris_Gallagher_D_taps(D, Do, Re_D)
+    L1, L2_prime = _Reader_Harris_Gallagher_taps(D, taps)
+    return _C_Reader_Harris_Gallagher(D, Do, Re_D, L1, L2_prime)
+
+
+def _Reader_Harris_Gallagher_taps(D, taps):
     if taps == 'corner':
         L1, L2_prime = 0.0, 0.0
     elif taps == 'flange':
@@ -508,12 +522,20 @@ def C_Reader_Harris_Gallagher(D, Do, rho, mu, m, taps='corner'):
         L2_prime = 0.47
     else:
         raise ValueError('Unsupported tap location')
+    return L1, L2_prime
 
+
+def _C_Reader_Harris_Gallagher(D, Do, Re_D, L1, L2_prime):
+    # Numerical kernel of `C_Reader_Harris_Gallagher` once the tap locations
+    # have been converted to `L1` and `L2_prime`; contains no string logic so
+    # it is compiled as-is by the numba interface.
+    Re_D_inv = 1.0/Re_D
+    beta = Do/D
     beta2 = beta*beta
     beta4 = beta2*beta2
-    beta8 = beta4*beta4
 
-    A = 2648.5177066967326*(beta*Re_D_inv)**0.8 # 19000.0^0.8 = 2648.51....
+    beta_Re_D_inv = beta*Re_D_inv
+    A = 2648.5177066967326*beta_Re_D_inv**0.8 # 19000.0^0.8 = 2648.51....
     M2_prime = 2.0*L2_prime/(1.0 - beta)
 
     # These two exps
@@ -523,22 +545,31 @@ def C_Reader_Harris_Gallagher(D, Do, rho, mu, m, taps='corner'):
     delta_C_upstream = ((0.043 + expnL3*expnL2*expnL2*(0.080*expnL3 - 0.123))
             *(1.0 - 0.11*A)*beta4/(1.0 - beta4))
 
-    # The max part is not in the ISO standard
-    t1 = log10(3700.*Re_D_inv)
-    if t1 < 0.0:
-        t1 = 0.0
-    delta_C_downstream = (-0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
-                          *(1.0 + 8.0*t1))
-
     # C_inf is discharge coefficient with corner taps for infinite Re
     # Cs, slope term, provides increase in discharge coefficient for lower
     # Reynolds numbers.
-    x1 = 63.095734448019314*(Re_D_inv)**0.3 # 63.095... = (1e6)**0.3
-    x2 = 22.7 - 0.0047*Re_D
-    t2 = x1 if x1 > x2 else x2
+    x1 = 63.095734448019314*Re_D_inv**0.3 # 63.095... = (1e6)**0.3
+
+    # Both max terms are not in the ISO standard; they only have an effect
+    # below Re_D = 3700 (the crossover of the slope term is at ~3690)
+    if Re_D < 3700.0:
+        low_Re_factor = 1.0 + 8.0*log10(3700.*Re_D_inv)
+        x2 = 22.7 - 0.0047*Re_D
+        t2 = x1 if x1 > x2 else x2
+    else:
+        low_Re_factor = 1.0
+        t2 = x1
+
+    if M2_prime > 0.0:
+        delta_C_downstream = (-0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
+                              *low_Re_factor)
+    else:
+        # Corner taps; M2_prime is zero and the term vanishes
+        delta_C_downstream = 0.0
+
     # max term is not in the ISO standard
-    C_inf_C_s = (0.5961 + 0.0261*beta2 - 0.216*beta8
-                 + 0.000521*(1E6*beta*Re_D_inv)**0.7
+    C_inf_C_s = (0.5961 + beta2*(0.0261 - 0.216*beta2*beta4)
+                 + 8.257293532722395*beta_Re_D_inv**0.7 # 0.000521*(1e6)**0.7
                  + (0.0188 + 0.0063*A)*beta2*beta*sqrt(beta)*(
                  t2))
 
@@ -559,6 +590,176 @@ def C_Reader_Harris_Gallagher(D, Do, rho, mu, m, taps='corner'):
     return C
 
 
+def _C_Reader_Harris_Gallagher_corner(D, Do, Re_D):
+    # `_C_Reader_Harris_Gallagher` with L1 = L2_prime = 0; the upstream
+    # coefficient is 0.043 + 0.080 - 0.123 = 0 and M2_prime is zero, so both
+    # tap terms vanish
+    Re_D_inv = 1.0/Re_D
+    beta = Do/D
+    beta2 = beta*beta
+    beta4 = beta2*beta2
+
+    beta_Re_D_inv = beta*Re_D_inv
+    A = 2648.5177066967326*beta_Re_D_inv**0.8 # 19000.0^0.8 = 2648.51....
+    t2 = 63.095734448019314*Re_D_inv**0.3 # 63.095... = (1e6)**0.3
+    if Re_D < 3700.0:
+        x2 = 22.7 - 0.0047*Re_D
+        if x2 > t2:
+            t2 = x2
+    C = (0.5961 + beta2*(0.0261 - 0.216*beta2*beta4)
+         + 8.257293532722395*beta_Re_D_inv**0.7 # 0.000521*(1e6)**0.7
+         + (0.0188 + 0.0063*A)*beta2*beta*sqrt(beta)*(
+         t2))
+    if D < 0.07112:
+        C += 0.011*(0.75 - beta)*(2.8 - D*inch_inv)
+    return C
+
+
+def _C_Reader_Harris_Gallagher_D_taps(D, Do, Re_D):
+    # `_C_Reader_Harris_Gallagher` with L1 = 1 and L2_prime = 0.47;
+    # 0.04289... = 0.043 + 0.080*exp(-10) - 0.123*exp(-7)
+    Re_D_inv = 1.0/Re_D
+    beta = Do/D
+    beta2 = beta*beta
+    beta4 = beta2*beta2
+
+    beta_Re_D_inv = beta*Re_D_inv
+    A = 2648.5177066967326*beta_Re_D_inv**0.8 # 19000.0^0.8 = 2648.51....
+    M2_prime = 0.94/(1.0 - beta)
+    delta_C_upstream = (0.04289147051261779*(1.0 - 0.11*A)*beta4/(1.0 - beta4))
+
+    x1 = 63.095734448019314*Re_D_inv**0.3 # 63.095... = (1e6)**0.3
+    if Re_D < 3700.0:
+        low_Re_factor = 1.0 + 8.0*log10(3700.*Re_D_inv)
+        x2 = 22.7 - 0.0047*Re_D
+        t2 = x1 if x1 > x2 else x2
+    else:
+        low_Re_factor = 1.0
+        t2 = x1
+    delta_C_downstream = (-0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
+                          *low_Re_factor)
+
+    C_inf_C_s = (0.5961 + beta2*(0.0261 - 0.216*beta2*beta4)
+                 + 8.257293532722395*beta_Re_D_inv**0.7 # 0.000521*(1e6)**0.7
+                 + (0.0188 + 0.0063*A)*beta2*beta*sqrt(beta)*(
+                 t2))
+
+    C = (C_inf_C_s + delta_C_upstream + delta_C_downstream)
+    if D < 0.07112:
+        C += 0.011*(0.75 - beta)*(2.8 - D*inch_inv)
+    return C
+
+
+class ReaderHarrisGallagherOrifice(object):
+    r"""Class representing an ISO 5167 orifice plate of fixed geometry, for
+    repeated evaluation of its discharge coefficient with the
+    Reader-Harris/Gallagher equation (see :obj:`C_Reader_Harris_Gallagher`).
+
+    Every term of the equation which depends only on the pipe diameter, the
+    orifice diameter, and the tap locations is computed once on
+    initialization; this is useful where one meter is evaluated at many
+    flow conditions, such as in transient or Monte-Carlo simulations.
+
+    Parameters
+    ----------
+    D : float
+        Upstream internal pipe diameter, [m]
+    Do : float
+        Diameter of orifice at flow conditions, [m]
+    taps : str
+        The orientation of the taps; one of 'corner', 'flange', 'D', or 'D/2',
+        [-]
+
+    Attributes
+    ----------
+    beta : float
+        Diameter ratio of the orifice, [-]
+    L1 : float
+        Quotient of the distance of the upstream tap from the upstream face
+        of the plate and the pipe diameter, [-]
+    L2_prime : float
+        Quotient of the distance of the downstream tap from the downstream
+        face of the plate and the pipe diameter, [-]
+
+    Examples
+    --------
+    >>> orifice = ReaderHarrisGallagherOrifice(D=0.07391, Do=0.0222, taps='flange')
+    >>> orifice.C(rho=1.165, mu=1.85E-5, m=0.12)
+    0.5990326277163659
+    """
+    def __repr__(self): # pragma : no cover
+        return '<Reader-Harris/Gallagher orifice, D=%s m, Do=%s m, taps=%s>' %(self.D, self.Do, self.taps)
+
+    def __init__(self, D, Do, taps='corner'):
+        self.D = D
+        self.Do = Do
+        self.taps = taps
+        self.L1, self.L2_prime = L1, L2_prime = _Reader_Harris_Gallagher_taps(D, taps)
+        self.beta = beta = Do/D
+        beta2 = beta*beta
+        beta4 = beta2*beta2
+
+        # Re_D = rho*v*D/mu = 4m/(pi*D*mu)
+        self._Re_D_factor = 1.0/(_quarter_pi*D)
+
+        # Coefficients of (1/Re_D)^0.8 and (1/Re_D)^0.7
+        self._A_factor = 2648.5177066967326*beta**0.8 # 19000.0^0.8 = 2648.51....
+        self._C_Re_factor = 8.257293532722395*beta**0.7 # 0.000521*(1e6)**0.7
+
+        expnL1 = exp(-L1)
+        expnL2 = expnL1*expnL1
+        expnL3 = expnL1*expnL2
+        self._upstream_factor = ((0.043 + expnL3*expnL2*expnL2*(0.080*expnL3 - 0.123))
+                                 *beta4/(1.0 - beta4))
+        M2_prime = 2.0*L2_prime/(1.0 - beta)
+        if M2_prime > 0.0:
+            self._downstream_factor = -0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
+        else:
+            self._downstream_factor = 0.0
+        self._beta_3_5 = beta2*beta*sqrt(beta)
+
+        C_base = 0.5961 + beta2*(0.0261 - 0.216*beta2*beta4)
+        if D < 0.07112:
+            C_base += 0.011*(0.75 - beta)*(2.8 - D*inch_inv)
+        self._C_base = C_base
+
+    def C(self, rho, mu, m):
+        r"""Calculate the coefficient of discharge of the orifice at the
+        specified flow conditions.
+
+        Parameters
+        ----------
+        rho : float
+            Density of fluid at `P1`, [kg/m^3]
+        mu : float
+            Viscosity of fluid at `P1`, [Pa*s]
+        m : float
+            Mass flow rate of fluid through the orifice, [kg/s]
+
+        Returns
+        -------
+        C : float
+            Coefficient of discharge of the orifice, [-]
+        """
+        Re_D = self._Re_D_factor*m/mu
+        Re_D_inv = 1.0/Re_D
+        A = self._A_factor*Re_D_inv**0.8
+
+        C = self._C_base + self._C_Re_factor*Re_D_inv**0.7
+        C += self._upstream_factor*(1.0 - 0.11*A)
+
+        t2 = 63.095734448019314*Re_D_inv**0.3 # 63.095... = (1e6)**0.3
+        if Re_D < 3700.0:
+            x2 = 22.7 - 0.0047*Re_D
+            if x2 > t2:
+                t2 = x2
+            C += self._downstream_factor*(1.0 + 8.0*log10(3700.*Re_D_inv))
+        else:
+            C += self._downstream_factor
+        C += (0.0188 + 0.0063*A)*self._beta_3_5*t2
+        return C
+
+
 _Miller_1996_unsupported_type = "Supported orifice types are %s" %str(
         (CONCENTRIC_ORIFICE, SEGMENTAL_ORIFICE, ECCENTRIC_ORIFICE,
          CONICAL_ORIFICE, QUARTER_CIRCLE_ORIFICE))
@@ -785,13 +986,14 @@ def C_Miller_1996(D, Do, rho, mu, m, subtype='orifice',
     .. [2] "RW Miller & Associates." Accessed April 13, 2020.
        http://rwmillerassociates.com/.
     '''
-    A_pipe = 0.25*pi*D*D
+    A_pipe = _quarter_pi*D*D
     v = m/(A_pipe*rho)
     Re = rho*v*D/mu
     D_mm = D*1000.0
 
     beta = Do/D
-    beta3 = beta*beta*beta
+    beta2 = beta*beta
+    beta3 = beta*beta2
     beta4 = beta*beta3
     beta8 = beta4*beta4
     beta21 = beta**2.1
@@ -819,32 +1021,32 @@ def C_Miller_1996(D, Do, rho, mu, m, subtype='orifice',
         if taps == ORIFICE_FLANGE_TAPS:
             if tap_position == TAPS_OPPOSITE:
                 if D < 0.1:
-                    b = 7.3 - 15.7*beta + 170.8*beta**2 - 399.7*beta3 + 332.2*beta4
+                    b = 7.3 - 15.7*beta + 170.8*beta2 - 399.7*beta3 + 332.2*beta4
                     C_inf = 0.5917 + 0.3061*beta21 + .3406*beta8 -.1019*beta4/(1-beta4) - 0.2715*beta3
                 else:
-                    b = -139.7 + 1328.8*beta - 4228.2*beta**2 + 5691.9*beta3 - 2710.4*beta4
+                    b = -139.7 + 1328.8*beta - 4228.2*beta2 + 5691.9*beta3 - 2710.4*beta4
                     C_inf = 0.6016 + 0.3312*beta21 - 1.5581*beta8 + 0.6510*beta4/(1-beta4) - 0.7308*beta3
             elif tap_position == TAPS_SIDE:
                 if D < 0.1:
-                    b = 69.1 - 469.4*beta + 1245.6*beta**2 -1287.5*beta3 + 486.2*beta4
+                    b = 69.1 - 469.4*beta + 1245.6*beta2 -1287.5*beta3 + 486.2*beta4
                     C_inf = 0.5866 + 0.3917*beta21 + 0.7586*beta8 -.2273*beta4/(1-beta4) - .3343*beta3
                 else:
-                    b = -103.2 + 898.3*beta - 2557.3*beta**2 + 2977.0*beta3 - 1131.3*beta4
+                    b = -103.2 + 898.3*beta - 2557.3*beta2 + 2977.0*beta3 - 1131.3*beta4
                     C_inf = 0.6037 + 0.1598*beta21 - 0.2918*beta8 + 0.0244*beta4/(1-beta4) - 0.0790*beta3
         elif taps == ORIFICE_VENA_CONTRACTA_TAPS:
             if tap_position == TAPS_OPPOSITE:
                 if D < 0.1:
-                    b = 23.3 -207.0*beta + 821.5*beta**2 -1388.6*beta3 + 900.3*beta4
+                    b = 23.3 -207.0*beta + 821.5*beta2 -1388.6*beta3 + 900.3*beta4
                     C_inf = 0.5925 + 0.3380*beta21 + 0.4016*beta8 -.1046*beta4/(1-beta4) - 0.3212*beta3
                 else:
-                    b = 55.7 - 471.4*beta + 1721.8*beta**2 - 2722.6*beta3 + 1569.4*beta4
+                    b = 55.7 - 471.4*beta + 1721.8*beta2 - 2722.6*beta3 + 1569.4*beta4
                     C_inf = 0.5922 + 0.3932*beta21 + .3412*beta8 -.0569*beta4/(1-beta4) - 0.4628*beta3
             elif tap_position == TAPS_SIDE:
                 if D < 0.1:
-                    b = -69.3 + 556.9*beta - 1332.2*beta**2 + 1303.7*beta3 - 394.8*beta4
+                    b = -69.3 + 556.9*beta - 1332.2*beta2 + 1303.7*beta3 - 394.8*beta4
                     C_inf = 0.5875 + 0.3813*beta21 + 0.6898*beta8 -0.1963*beta4/(1-beta4) - 0.3366*beta3
                 else:
-                    b = 52.8 - 434.2*beta + 1571.2*beta**2 - 2460.9*beta3 + 1420.2*beta4
+                    b = 52.8 - 434.2*beta + 1571.2*beta2 - 2460.9*beta3 + 1420.2*beta4
                     C_inf = 0.5949 + 0.4078*beta21 + 0.0547*beta8 +0.0955*beta4/(1-beta4) - 0.5608*beta3
         else:
             raise ValueError(_Miller_1996_unsupported_tap_eccentric)
@@ -1217,8 +1419,9 @@ def dP_orifice(D, Do, P1, P2, C):
     beta2 = beta*beta
     beta4 = beta2*beta2
     dP = P1 - P2
-    delta_w = (sqrt(1.0 - beta4*(1.0 - C*C)) - C*beta2)/(
-               sqrt(1.0 - beta4*(1.0 - C*C)) + C*beta2)*dP
+    root = sqrt(1.0 - beta4*(1.0 - C*C))
+    C_beta2 = C*beta2
+    delta_w = (root - C_beta2)/(root + C_beta2)*dP
     return delta_w
 
 
@@ -1254,7 +1457,9 @@ def velocity_of_approach_factor(D, Do):
     .. [1] American Society of Mechanical Engineers. Mfc-3M-2004 Measurement
        Of Fluid Flow In Pipes Using Orifice, Nozzle, And Venturi. ASME, 2001.
     '''
-    return 1.0/sqrt(1.0 - (Do/D)**4)
+    beta = Do/D
+    beta2 = beta*beta
+    return 1.0/sqrt(1.0 - beta2*beta2)
 
 
 def flow_coefficient(D, Do, C):
@@ -1299,7 +1504,9 @@ def flow_coefficient(D, Do, C):
     .. [2] Miller, Richard W. Flow Measurement Engineering Handbook. 3rd
        edition. New York: McGraw-Hill Education, 1996.
     '''
-    return C*1.0/sqrt(1.0 - (Do/D)**4)
+    beta = Do/D
+    beta2 = beta*beta
+    return C/sqrt(1.0 - beta2*beta2)
 
 
 def nozzle_expansibility(D, Do, P1, P2, k, beta=None):
@@ -1391,8 +1598,10 @@ def nozzle_expansibility(D, Do, P1, P2, k, beta=None):
                     - D**4*P1**2*P2 - Do**4*P1*P2**2 + Do**4*P2**3))
         return sqrt(limit_val)
     
-    term1 = k*tau**(2.0/k)/(k - 1.0)
-    term2 = (1.0 - beta4)/(1.0 - beta4*tau**(2.0/k))
+    # tau**(-1/k) in term3 is 1/sqrt(tau**(2/k)); one pow serves all terms
+    tau_2k = tau**(2.0/k)
+    term1 = k*tau_2k/(k - 1.0)
+    term2 = (1.0 - beta4)/(1.0 - beta4*tau_2k)
     if tau == 1.0:
         '''Avoid a zero division error.
         Obtained with:
@@ -1405,7 +1614,7 @@ def nozzle_expansibility(D, Do, P1, P2, k, beta=None):
     else:
         # This form of the equation is mathematically equivalent but
         # does not have issues where k = `.
-        term3 = (P1 - P2*(tau)**(-1.0/k))/(P1 - P2)
+        term3 = (P1 - P2/sqrt(tau_2k))/(P1 - P2)
         # term3 = (1.0 - tau**((k - 1.0)/k))/(1.0 - tau)
     return sqrt(term1*term2*term3)
 
@@ -1453,9 +1662,8 @@ def C_long_radius_nozzle(D, Do, rho, mu, m):
        Differential Devices Inserted in Circular Cross-Section Conduits Running
        Full -- Part 3: Nozzles and Venturi Nozzles.
     '''
-    A_pipe = pi/4.*D*D
-    v = m/(A_pipe*rho)
-    Re_D = rho*v*D/mu
+    A_pipe = _quarter_pi*D*D
+    Re_D = m*D/(A_pipe*mu)
     beta = Do/D
     return 0.9965 - 0.00653*sqrt(beta)*sqrt(1E6/Re_D)
 
@@ -1504,12 +1712,15 @@ def C_ISA_1932_nozzle(D, Do, rho, mu, m):
        Differential Devices Inserted in Circular Cross-Section Conduits Running
        Full -- Part 3: Nozzles and Venturi Nozzles.
     '''
-    A_pipe = pi/4.*D*D
-    v = m/(A_pipe*rho)
-    Re_D = rho*v*D/mu
+    A_pipe = _quarter_pi*D*D
+    Re_D = m*D/(A_pipe*mu)
     beta = Do/D
-    C = (0.9900 - 0.2262*beta**4.1
-         - (0.00175*beta**2 - 0.0033*beta**4.15)*(1E6/Re_D)**1.15)
+    beta2 = beta*beta
+    # beta**4.1 and beta**4.15 from a single fractional power
+    beta_0_05 = beta**0.05
+    beta_4_1 = beta2*beta2*beta_0_05*beta_0_05
+    C = (0.9900 - 0.2262*beta_4_1
+         - beta2*(0.00175 - 0.0033*beta2*beta_0_05*beta_0_05*beta_0_05)*(1E6/Re_D)**1.15)
     return C
 
 
@@ -1592,6 +1803,23 @@ venturi_tube_dP_low = [0.089232, 0.089218, 0.088671, 0.088435, 0.088206,
 #ratios_average = 0.5*(ratios_high + ratios_low)
 D_bound_venturi_tube = [0.065, 0.5]
 
+# One row per segment of the two loss curves, [beta, high, high slope, low,
+# low slope], so both are interpolated from a single search of
+# `venturi_tube_betas` and a single row lookup. The first and last rows have
+# no slope, holding the curves constant outside the tabulated range.
+_venturi_tube_dP_segments = ([[venturi_tube_betas[0], venturi_tube_dP_high[0], 0.0,
+                               venturi_tube_dP_low[0], 0.0]]
+                             + [[venturi_tube_betas[i],
+                                 venturi_tube_dP_high[i],
+                                 (venturi_tube_dP_high[i+1] - venturi_tube_dP_high[i])
+                                 /(venturi_tube_betas[i+1] - venturi_tube_betas[i]),
+                                 venturi_tube_dP_low[i],
+                                 (venturi_tube_dP_low[i+1] - venturi_tube_dP_low[i])
+                                 /(venturi_tube_betas[i+1] - venturi_tube_betas[i])]
+                                for i in range(len(venturi_tube_betas) - 1)]
+                             + [[venturi_tube_betas[-1], venturi_tube_dP_high[-1], 0.0,
+                                 venturi_tube_dP_low[-1], 0.0]])
+
 
 def dP_venturi_tube(D, Do, P1, P2):
     r'''Calculates the non-recoverable pressure drop of a venturi tube
@@ -1648,9 +1876,24 @@ def dP_venturi_tube(D, Do, P1, P2):
     '''
     # Effect of Re is not currently included
     beta = Do/D
-    epsilon_D65 = interp(beta, venturi_tube_betas, venturi_tube_dP_high)
-    epsilon_D500 = interp(beta, venturi_tube_betas, venturi_tube_dP_low)
-    epsilon = interp(D, D_bound_venturi_tube, [epsilon_D65, epsilon_D500])
+    # Both curves share `venturi_tube_betas`.
+    # The C search from `bisect` is much faster than `binary_search` in CPython
+    i = bisect_right(venturi_tube_betas, beta) # numba: delete
+#    i = min(binary_search(beta, venturi_tube_betas) + 1, len(venturi_tube_betas)) # numba: uncomment
+    segment = _venturi_tube_dP_segments[i]
+    dbeta = beta - segment[0]
+    # Linear blend between the two diameter bounds, held constant outside
+    # them; same result as interpolating over `D_bound_venturi_tube`. Only the
+    # curves that are needed are evaluated. Keep the products as
+    # `dbeta*segment[k]`; fluids.numba rewrites `[k]*dbeta` as a list repeat
+    if D <= 0.065:
+        epsilon = dbeta*segment[2] + segment[1]
+    elif D >= 0.5:
+        epsilon = dbeta*segment[4] + segment[3]
+    else:
+        epsilon_D65 = dbeta*segment[2] + segment[1]
+        epsilon_D500 = dbeta*segment[4] + segment[3]
+        epsilon = (epsilon_D500 - epsilon_D65)/(0.5 - 0.065)*(D - 0.065) + epsilon_D65
     return epsilon*(P1 - P2)
 
 
@@ -1747,10 +1990,10 @@ def cone_meter_expansibility_Stewart(D, Dc, P1, P2, k):
        Full -- Part 5: Cone meters.
     '''
     dP = P1 - P2
-    beta = diameter_ratio_cone_meter(D, Dc)
-    beta *= beta
-    beta *= beta
-    return 1.0 - (0.649 + 0.696*beta)*dP/(k*P1)
+    # beta**2 = 1 - (Dc/D)**2; no need for the square root
+    D_ratio = Dc/D
+    beta2 = 1.0 - D_ratio*D_ratio
+    return 1.0 - (0.649 + 0.696*beta2*beta2)*dP/(k*P1)
 
 
 def dP_cone_meter(D, Dc, P1, P2):
@@ -1796,7 +2039,8 @@ def dP_cone_meter(D, Dc, P1, P2):
        Full -- Part 5: Cone meters.
     '''
     dP = P1 - P2
-    beta = diameter_ratio_cone_meter(D, Dc)
+    D_ratio = Dc/D
+    beta = sqrt(1.0 - D_ratio*D_ratio)
     return (1.09 - 0.813*beta)*dP
 
 
@@ -2021,8 +2265,7 @@ def dP_wedge_meter(D, H, P1, P2):
 def C_Reader_Harris_Gallagher_wet_venturi_tube(mg, ml, rhog, rhol, D, Do, H=1):
     r'''Calculates the coefficient of discharge of the wet gas venturi tube
     based on the  geometry of the tube, mass flow rates of liquid and vapor
-    through the tube, the density of the liquid and gas phases, and an
-    adjustable coefficient `H`.
+    through the tube, and the density of the liquid and gas phases.
 
     .. math::
         C = 1 - 0.0463\exp(-0.05Fr_{gas, th}) \cdot \min\left(1,
@@ -2031,17 +2274,6 @@ def C_Reader_Harris_Gallagher_wet_venturi_tube(mg, ml, rhog, rhol, D, Do, H=1):
     .. math::
         Fr_{gas, th} = \frac{Fr_{\text{gas, densionetric }}}{\beta^{2.5}}
 
-    .. math::
-        \phi = \sqrt{1 + C_{Ch} X + X^2}
-
-    .. math::
-        C_{Ch} = \left(\frac{\rho_l}{\rho_{1,g}}\right)^n +
-        \left(\frac{\rho_{1, g}}{\rho_{l}}\right)^n
-
-    .. math::
-        n = \max\left[0.583 - 0.18\beta^2 - 0.578\exp\left(\frac{-0.8
-        Fr_{\text{gas, densiometric}}}{H}\right),0.392 - 0.18\beta^2 \right]
-
     .. math::
         X = \left(\frac{m_l}{m_g}\right) \sqrt{\frac{\rho_{1,g}}{\rho_l}}
 
@@ -2068,7 +2300,8 @@ def C_Reader_Harris_Gallagher_wet_venturi_tube(mg, ml, rhog, rhol, D, Do, H=1):
     H : float, optional
         A surface-tension effect coefficient used to adjust for different
         fluids, (1 for a hydrocarbon liquid, 1.35 for water, 0.79 for water in
-        steam) [-]
+        steam); it only enters the over-reading and has no effect on the
+        returned `C`, [-]
 
     Returns
     -------
@@ -2078,6 +2311,21 @@ def C_Reader_Harris_Gallagher_wet_venturi_tube(mg, ml, rhog, rhol, D, Do, H=1):
 
     Notes
     -----
+    The model of [1]_ also defines an over-reading :math:`\phi`, which is
+    where `H` enters through `n`; :math:`\phi`, :math:`C_{Ch}` and `n` are not
+    used in calculating `C`:
+
+    .. math::
+        \phi = \sqrt{1 + C_{Ch} X + X^2}
+
+    .. math::
+        C_{Ch} = \left(\frac{\rho_l}{\rho_{1,g}}\right)^n +
+        \left(\frac{\rho_{1, g}}{\rho_{l}}\right)^n
+
+    .. math::
+        n = \max\left[0.583 - 0.18\beta^2 - 0.578\exp\left(\frac{-0.8
+        Fr_{\text{gas, densiometric}}}{H}\right),0.392 - 0.18\beta^2 \right]
+
     This model has more error than single phase differential pressure meters.
     The model was first published in [1]_, and became ISO 11583 later.
 
@@ -2117,16 +2365,11 @@ def C_Reader_Harris_Gallagher_wet_venturi_tube(mg, ml, rhog, rhol, D, Do, H=1):
     beta2 = beta*beta
     Fr_gas_th = Frg/(beta2*sqrt(beta))
 
-    n = max(0.583 - 0.18*beta2 - 0.578*exp(-0.8*Frg/H),
-            0.392 - 0.18*beta2)
-
-    t0 = rhog/rhol
-    t1 = (t0)**n
-    C_Ch = t1 + 1.0/t1
-    X =  ml/mg*sqrt(t0)
-    # OF = sqrt(1.0 + X*(C_Ch + X))
+    # `n` and `C_Ch` (and so `H`) only enter the over-reading
+    # OF = sqrt(1 + X*(C_Ch + X)), which is not needed for C
+    X =  ml/mg*sqrt(rhog/rhol)
 
-    C = 1.0 - 0.0463*exp(-0.05*Fr_gas_th)*min(1.0, sqrt(X/0.016))
+    C = 1.0 - 0.0463*exp(-0.05*Fr_gas_th)*(sqrt(62.5*X) if X < 0.016 else 1.0)
     return C
 
 
@@ -2357,6 +2600,15 @@ and their correlations.
 '''
 _unsupported_meter_msg = "Supported meter types are %s" % all_meters
 
+# Meters with a discharge coefficient which does not depend on the flow rate
+_flow_independent_C_meters = frozenset([ISO_15377_ECCENTRIC_ORIFICE,
+                                        ISO_15377_QUARTER_CIRCLE_ORIFICE,
+                                        ISO_15377_CONICAL_ORIFICE, VENTURI_NOZZLE,
+                                        AS_CAST_VENTURI_TUBE,
+                                        MACHINED_CONVERGENT_VENTURI_TUBE,
+                                        ROUGH_WELDED_CONVERGENT_VENTURI_TUBE,
+                                        CONE_METER, WEDGE_METER])
+
 def differential_pressure_meter_beta(D, D2, meter_type):
     r'''Calculates the beta ratio of a differential pressure meter.
 
@@ -2493,9 +2745,25 @@ def differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho, mu, k,
     >>> differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
     ... P2=183000.0, rho=999.1, mu=0.0011, k=1.33, m=7.702338035732168,
     ... meter_type='ISO 5167 orifice', taps='D')
-    (0.6151252900244296, 0.9711026966676307)
+    (0.6151252900244297, 0.9711026966676307)
     '''
-#    # Translate default meter type to implementation specific correlation
+    meter_type = _translate_meter_type(meter_type)
+    if C_specified is None:
+        C = _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps,
+                                     tap_position)
+    else:
+        if meter_type not in all_meters:
+            raise ValueError(_unsupported_meter_msg)
+        C = C_specified
+    if epsilon_specified is None:
+        epsilon = _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type)
+    else:
+        epsilon = epsilon_specified
+    return C, epsilon
+
+
+def _translate_meter_type(meter_type):
+    # Translate default meter type to implementation specific correlation
     if meter_type == CONCENTRIC_ORIFICE:
         meter_type = ISO_5167_ORIFICE
     elif meter_type == ECCENTRIC_ORIFICE:
@@ -2506,134 +2774,156 @@ def differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho, mu, k,
         meter_type = ISO_15377_QUARTER_CIRCLE_ORIFICE
     elif meter_type == SEGMENTAL_ORIFICE:
         meter_type = MILLER_SEGMENTAL_ORIFICE
+    return meter_type
+
 
+def _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps, tap_position):
     if meter_type == ISO_5167_ORIFICE:
         C = C_Reader_Harris_Gallagher(D, D2, rho, mu, m, taps)
-        epsilon = orifice_expansibility(D, D2, P1, P2, k)
     elif meter_type == ISO_15377_ECCENTRIC_ORIFICE:
         C = C_eccentric_orifice_ISO_15377_1998(D, D2)
-        epsilon = orifice_expansibility(D, D2, P1, P2, k)
     elif meter_type == ISO_15377_QUARTER_CIRCLE_ORIFICE:
         C = C_quarter_circle_orifice_ISO_15377_1998(D, D2)
-        epsilon = orifice_expansibility(D, D2, P1, P2, k)
     elif meter_type == ISO_15377_CONICAL_ORIFICE:
         C = ISO_15377_CONICAL_ORIFICE_C
-        # Average of concentric square edge orifice and ISA 1932 nozzles
-        epsilon = 0.5*(orifice_expansibility(D, D2, P1, P2, k)
-                       + nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k))
-
     elif meter_type in (MILLER_ORIFICE, MILLER_ECCENTRIC_ORIFICE,
-                      MILLER_SEGMENTAL_ORIFICE, MILLER_QUARTER_CIRCLE_ORIFICE):
-        C = C_Miller_1996(D, D2, rho, mu, m, subtype=meter_type, taps=taps,
-                          tap_position=tap_position)
-        epsilon = orifice_expansibility(D, D2, P1, P2, k)
-    elif meter_type == MILLER_CONICAL_ORIFICE:
+                        MILLER_SEGMENTAL_ORIFICE, MILLER_QUARTER_CIRCLE_ORIFICE,
+                        MILLER_CONICAL_ORIFICE):
         C = C_Miller_1996(D, D2, rho, mu, m, subtype=meter_type, taps=taps,
                           tap_position=tap_position)
-        epsilon = 0.5*(orifice_expansibility(D, D2, P1, P2, k)
-                       + nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k))
     elif meter_type == LONG_RADIUS_NOZZLE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = C_long_radius_nozzle(D=D, Do=D2, rho=rho, mu=mu, m=m)
     elif meter_type == ISA_1932_NOZZLE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = C_ISA_1932_nozzle(D=D, Do=D2, rho=rho, mu=mu, m=m)
     elif meter_type == VENTURI_NOZZLE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = C_venturi_nozzle(D=D, Do=D2)
-
     elif meter_type == AS_CAST_VENTURI_TUBE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = AS_CAST_VENTURI_TUBE_C
     elif meter_type == MACHINED_CONVERGENT_VENTURI_TUBE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = MACHINED_CONVERGENT_VENTURI_TUBE_C
     elif meter_type == ROUGH_WELDED_CONVERGENT_VENTURI_TUBE:
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
         C = ROUGH_WELDED_CONVERGENT_VENTURI_TUBE_C
-
     elif meter_type == CONE_METER:
-        epsilon = cone_meter_expansibility_Stewart(D=D, Dc=D2, P1=P1, P2=P2, k=k)
         C = CONE_METER_C
     elif meter_type == WEDGE_METER:
-        beta = diameter_ratio_wedge_meter(D=D, H=D2)
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P1, k=k, beta=beta)
         C = C_wedge_meter_ISO_5167_6_2017(D=D, H=D2)
     elif meter_type == HOLLINGSHEAD_ORIFICE:
-        v = m/((0.25*pi*D*D)*rho)
-        Re_D = rho*v*D/mu
+        Re_D = m/(_quarter_pi*D*mu)
         C = float(bisplev(D2/D, log(Re_D), orifice_std_Hollingshead_tck))
-        epsilon = orifice_expansibility(D, D2, P1, P2, k)
     elif meter_type == HOLLINGSHEAD_VENTURI_SMOOTH:
-        v = m/((0.25*pi*D*D)*rho)
-        Re_D = rho*v*D/mu
+        Re_D = m/(_quarter_pi*D*mu)
         C = interp(log(Re_D), venturi_logRes_Hollingshead, venturi_smooth_Cs_Hollingshead, extrapolate=True)
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
     elif meter_type == HOLLINGSHEAD_VENTURI_SHARP:
-        v = m/((0.25*pi*D*D)*rho)
-        Re_D = rho*v*D/mu
+        Re_D = m/(_quarter_pi*D*mu)
         C = interp(log(Re_D), venturi_logRes_Hollingshead, venturi_sharp_Cs_Hollingshead, extrapolate=True)
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
     elif meter_type == HOLLINGSHEAD_CONE:
-        v = m/((0.25*pi*D*D)*rho)
-        Re_D = rho*v*D/mu
+        Re_D = m/(_quarter_pi*D*mu)
         beta = diameter_ratio_cone_meter(D, D2)
         C = float(bisplev(beta, log(Re_D), cone_Hollingshead_tck))
-        epsilon = cone_meter_expansibility_Stewart(D=D, Dc=D2, P1=P1, P2=P2, k=k)
     elif meter_type == HOLLINGSHEAD_WEDGE:
-        v = m/((0.25*pi*D*D)*rho)
-        Re_D = rho*v*D/mu
+        Re_D = m/(_quarter_pi*D*mu)
         beta = diameter_ratio_wedge_meter(D=D, H=D2)
         C = float(bisplev(beta, log(Re_D), wedge_Hollingshead_tck))
-        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P1, k=k, beta=beta)
     elif meter_type == UNSPECIFIED_METER:
-        epsilon = orifice_expansibility(D, D2, P1, P2, k) # Default to orifice type expansibility
-        if C_specified is None:
-            raise ValueError("For unspecified meter type, C_specified is required")
+        raise ValueError("For unspecified meter type, C_specified is required")
     else:
         raise ValueError(_unsupported_meter_msg)
-    if C_specified is not None:
-        C = C_specified
-    if epsilon_specified is not None:
-        epsilon = epsilon_specified
-    return C, epsilon
+    return C
 
 
+def _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type):
+    # The expansibility factor does not depend on the flow rate
+    if meter_type in (ISO_5167_ORIFICE, ISO_15377_ECCENTRIC_ORIFICE,
+                      ISO_15377_QUARTER_CIRCLE_ORIFICE, MILLER_ORIFICE,
+                      MILLER_ECCENTRIC_ORIFICE, MILLER_SEGMENTAL_ORIFICE,
+                      MILLER_QUARTER_CIRCLE_ORIFICE, HOLLINGSHEAD_ORIFICE,
+                      UNSPECIFIED_METER):
+        # Default to orifice type expansibility for unspecified meters
+        epsilon = orifice_expansibility(D, D2, P1, P2, k)
+    elif meter_type == ISO_15377_CONICAL_ORIFICE or meter_type == MILLER_CONICAL_ORIFICE:
+        # Average of concentric square edge orifice and ISA 1932 nozzles
+        epsilon = 0.5*(orifice_expansibility(D, D2, P1, P2, k)
+                       + nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k))
+    elif meter_type in (LONG_RADIUS_NOZZLE, ISA_1932_NOZZLE, VENTURI_NOZZLE,
+                        AS_CAST_VENTURI_TUBE, MACHINED_CONVERGENT_VENTURI_TUBE,
+                        ROUGH_WELDED_CONVERGENT_VENTURI_TUBE,
+                        HOLLINGSHEAD_VENTURI_SMOOTH, HOLLINGSHEAD_VENTURI_SHARP):
+        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P2, k=k)
+    elif meter_type == CONE_METER or meter_type == HOLLINGSHEAD_CONE:
+        epsilon = cone_meter_expansibility_Stewart(D=D, Dc=D2, P1=P1, P2=P2, k=k)
+    elif meter_type == WEDGE_METER or meter_type == HOLLINGSHEAD_WEDGE:
+        beta = diameter_ratio_wedge_meter(D=D, H=D2)
+        epsilon = nozzle_expansibility(D=D, Do=D2, P1=P1, P2=P1, k=k, beta=beta)
+    else:
+        raise ValueError(_unsupported_meter_msg)
+    return epsilon
+
 
-def err_dp_meter_solver_m(m_D, D, D2, P1, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified):
+def err_dp_meter_solver_m(m_D, D, D2, rho, mu, meter_type, taps, tap_position, m_per_C):
+    # `m_per_C` is the flow rate with a discharge coefficient of one; it
+    # includes the expansibility and does not depend on the flow rate
     m = m_D*D
-    C, epsilon = differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho,
-                                                  mu, k, meter_type,
-                                                  taps=taps, tap_position=tap_position,
-                                                  C_specified=C_specified, epsilon_specified=epsilon_specified)
-    m_calc = flow_meter_discharge(D=D, Do=D2, P1=P1, P2=P2, rho=rho,
-                                C=C, expansibility=epsilon)
-    err =  m - m_calc
+    C = _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps,
+                                 tap_position)
+    err = m - C*m_per_C
     return err
 
-def err_dp_meter_solver_P2(P2, D, D2, m, P1, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified):
-    C, epsilon = differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho,
-                                                  mu, k, meter_type,
-                                                  taps=taps, tap_position=tap_position,
-                                                  C_specified=C_specified, epsilon_specified=epsilon_specified)
+def err_dp_meter_solver_m_RHG(m_D, D, D2, Re_D_per_m_D, L1, L2_prime, m_per_C):
+    # ISO 5167 orifice specialization of `err_dp_meter_solver_m`; the taps
+    # are resolved before the solve and the kernels are called directly.
+    # Re_D = m/(pi/4*D*mu) = m_D/(pi/4*mu) is linear in the unknown.
+    Re_D = m_D*Re_D_per_m_D
+    # Specialized kernels only for the exact spacings of corner and D and D/2
+    # taps (see `_Reader_Harris_Gallagher_taps`); any other spacing, as may be
+    # passed to the vectorized solver, uses the general correlation
+    if L1 == 0.0 and L2_prime == 0.0:
+        C = _C_Reader_Harris_Gallagher_corner(D, D2, Re_D)
+    elif L1 == 1.0 and L2_prime == 0.47:
+        C = _C_Reader_Harris_Gallagher_D_taps(D, D2, Re_D)
+    else:
+        C = _C_Reader_Harris_Gallagher(D, D2, Re_D, L1, L2_prime)
+    return m_D*D - C*m_per_C
+
+def _differential_pressure_meter_solver_m_RHG(D, D2, mu, L1, L2_prime, m_per_C):
+    # Mass flow solve of the ISO 5167 orifice once the taps and the flow rate
+    # at C = 1 are known; free of strings, so numba_vectorized compiles it to
+    # a ufunc for batches of meters
+    args = (D, D2, 1.0/(_quarter_pi*mu), L1, L2_prime, m_per_C)
+    # Sharp edged orifices have C ~ 0.6; saves an iteration on average
+    try:
+        return secant(err_dp_meter_solver_m_RHG, 0.6*m_per_C/D, args=args, low=1e-40)*D
+    except:
+        return brenth(err_dp_meter_solver_m_RHG, 0.1*m_per_C/D, 1.5*m_per_C/D, args=args)*D
+
+def err_dp_meter_solver_P2(P2, D, D2, m, P1, rho, k, meter_type, C, epsilon_specified):
+    # With `m` known, `C` is fixed for the solve; only `epsilon` depends on P2
+    if epsilon_specified is None:
+        epsilon = _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type)
+    else:
+        epsilon = epsilon_specified
     m_calc = flow_meter_discharge(D=D, Do=D2, P1=P1, P2=P2, rho=rho,
                                 C=C, expansibility=epsilon)
     return m - m_calc
 
 def err_dp_meter_solver_D2(D2, D, m, P1, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified):
-    C, epsilon = differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho,
-                                                  mu, k, meter_type,
-                                                  taps=taps, tap_position=tap_position, C_specified=C_specified,
-                                                  epsilon_specified=epsilon_specified)
+    if C_specified is None:
+        C = _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps,
+                                     tap_position)
+    else:
+        C = C_specified
+    if epsilon_specified is None:
+        epsilon = _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type)
+    else:
+        epsilon = epsilon_specified
     m_calc = flow_meter_discharge(D=D, Do=D2, P1=P1, P2=P2, rho=rho,
                                 C=C, expansibility=epsilon)
     return m - m_calc
 
-def err_dp_meter_solver_P1(P1, D, D2, m, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified):
-    C, epsilon = differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho,
-                                                  mu, k, meter_type,
-                                                  taps=taps, tap_position=tap_position, C_specified=C_specified,
-                                                  epsilon_specified=epsilon_specified)
+def err_dp_meter_solver_P1(P1, D, D2, m, P2, rho, k, meter_type, C, epsilon_specified):
+    if epsilon_specified is None:
+        epsilon = _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type)
+    else:
+        epsilon = epsilon_specified
     m_calc = flow_meter_discharge(D=D, Do=D2, P1=P1, P2=P2, rho=rho,
                                 C=C, expansibility=epsilon)
     return m - m_calc
@@ -2735,41 +3025,76 @@ def differential_pressure_meter_solver(D, rho, mu, k=None, D2=None, P1=None, P2=
     >>> differential_pressure_meter_solver(D=0.07366, m=7.702338, P1=200000.0,
     ... P2=183000.0, rho=999.1, mu=0.0011, k=1.33,
     ... meter_type='ISO 5167 orifice', taps='D')
-    0.04999999990831885
+    0.04999999990836354
     '''
     if k is None and epsilon_specified is not None:
         k = 1.4
+    # Resolve the meter type once; the residuals dispatch on it directly
+    meter_type = _translate_meter_type(meter_type)
+    if C_specified is not None and meter_type not in all_meters:
+        raise ValueError(_unsupported_meter_msg)
     if m is None and D is not None and D2 is not None and P1 is not None and P2 is not None:
-        # Initialize via analytical formulas
+        # Neither the expansibility nor the geometric part of the discharge
+        # equation depend on the flow rate; evaluate them only once
+        if epsilon_specified is None:
+            epsilon = _differential_pressure_epsilon(D, D2, P1, P2, k, meter_type)
+        else:
+            if meter_type not in all_meters:
+                raise ValueError(_unsupported_meter_msg)
+            epsilon = epsilon_specified
+        m_per_C = flow_meter_discharge(D=D, Do=D2, P1=P1, P2=P2, rho=rho,
+                                       C=1.0, expansibility=epsilon)
+        # No iteration is needed when C does not depend on the flow rate
+        if C_specified is not None:
+            return C_specified*m_per_C
+        elif meter_type in _flow_independent_C_meters:
+            return _differential_pressure_C(D, D2, m_per_C, rho, mu, meter_type,
+                                            taps, tap_position)*m_per_C
+        if meter_type == ISO_5167_ORIFICE:
+            L1, L2_prime = _Reader_Harris_Gallagher_taps(D, taps)
+            return _differential_pressure_meter_solver_m_RHG(D, D2, mu, L1, L2_prime, m_per_C)
+        # Initialize from a typical discharge coefficient
         C_guess = 0.7
-        D4 = D*D
-        D4 *= D4
-        D24 = D2*D2
-        D24 *= D24
-        m_guess = root_two*pi*C_guess*D2*D2*sqrt(D4*rho*(P1 - P2)/(D4 - D24))*0.25
-        m_D_guess = m_guess/D
-        # Diameter to mass flow ratio
-        # m_D_guess = 40
-        # if rho < 100.0:
-        #     m_D_guess *= 1e-2
-        return secant(err_dp_meter_solver_m, m_D_guess, args=(D, D2, P1, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified), low=1e-40)*D
+        m_D_guess = C_guess*m_per_C/D
+        args = (D, D2, rho, mu, meter_type, taps, tap_position, m_per_C)
+        try:
+            return secant(err_dp_meter_solver_m, m_D_guess, args=args, low=1e-40)*D
+        except:
+            # Bounded fallback - discharge coefficients between 0.1 and 1.5
+            return brenth(err_dp_meter_solver_m, 0.1*m_per_C/D, 1.5*m_per_C/D, args=args)*D
     elif D2 is None and D is not None and m is not None and P1 is not None and P2 is not None:
         args = (D, m, P1, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified)
+        # Initialize by inverting m = C*epsilon*A2*sqrt(2*rho*dP/(1 - beta^4))
+        # for beta with C*epsilon = 0.7
+        K = m/(0.7*_quarter_pi*D*D*sqrt(2.0*rho*(P1 - P2)))
+        D2_guess = D*sqrt(K/sqrt(1.0 + K*K))
         try:
-            return brenth(err_dp_meter_solver_D2, D*(1-1E-9), D*5E-3, args=args)
+            return secant(err_dp_meter_solver_D2, D2_guess, args=args, high=D, low=D*1e-10, xtol=D*1e-12)
         except:
             try:
-                return secant(err_dp_meter_solver_D2, D*.3, args=args, high=D, low=D*1e-10)
+                return brenth(err_dp_meter_solver_D2, D*5E-3, D*(1-1E-9), args=args)
             except:
-                return secant(err_dp_meter_solver_D2, D*.75, args=args, high=D, low=D*1e-10)
+                try:
+                    return secant(err_dp_meter_solver_D2, D*.3, args=args, high=D, low=D*1e-10)
+                except:
+                    return secant(err_dp_meter_solver_D2, D*.75, args=args, high=D, low=D*1e-10)
     elif P2 is None and D is not None and D2 is not None and m is not None and P1 is not None:
-        args = (D, D2, m, P1, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified)
+        # The discharge coefficient depends only on the flow rate and geometry
+        if C_specified is None:
+            C = _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps, tap_position)
+        else:
+            C = C_specified
+        args = (D, D2, m, P1, rho, k, meter_type, C, epsilon_specified)
         try:
             return brenth(err_dp_meter_solver_P2, P1*(1-1E-9), P1*0.5, args=args)
         except:
             return secant(err_dp_meter_solver_P2, P1*0.5, low=P1*1e-10, args=args, high=P1, bisection=True)
     elif P1 is None and D is not None and D2 is not None and m is not None and P2 is not None:
-        args = (D, D2, m, P2, rho, mu, k, meter_type, taps, tap_position, C_specified, epsilon_specified)
+        if C_specified is None:
+            C = _differential_pressure_C(D, D2, m, rho, mu, meter_type, taps, tap_position)
+        else:
+            C = C_specified
+        args = (D, D2, m, P2, rho, k, meter_type, C, epsilon_specified)
         try:
             return brenth(err_dp_meter_solver_P1, P2*(1+1E-9), P2*1.4, args=args)
         except:
@@ -166,13 +166,10 @@ def err_dp_meter_solver_P1(
     m: float,
     P2: float,
     rho: float,
-    mu: float,
     k: float,
     meter_type: str,
-    taps: Optional[str],
-    tap_position: Optional[str],
-    C_specified: Optional[float],
-    epsilon_specified: None
+    C: float,
+    epsilon_specified: Optional[float]
 ) -> float: ...
 
 
@@ -183,13 +180,10 @@ def err_dp_meter_solver_P2(
     m: float,
     P1: float,
     rho: float,
-    mu: float,
     k: float,
     meter_type: str,
-    taps: Optional[str],
-    tap_position: Optional[str],
-    C_specified: Optional[float],
-    epsilon_specified: None
+    C: float,
+    epsilon_specified: Optional[float]
 ) -> float: ...
 
 
@@ -197,16 +191,23 @@ def err_dp_meter_solver_m(
     m_D: float,
     D: float,
     D2: float,
-    P1: float,
-    P2: float,
     rho: float,
     mu: float,
-    k: float,
     meter_type: str,
     taps: Optional[str],
     tap_position: Optional[str],
-    C_specified: Optional[float],
-    epsilon_specified: Optional[int]
+    m_per_C: float
+) -> float: ...
+
+
+def err_dp_meter_solver_m_RHG(
+    m_D: float,
+    D: float,
+    D2: float,
+    Re_D_per_m_D: float,
+    L1: float,
+    L2_prime: float,
+    m_per_C: float
 ) -> float: ...
 
 
@@ -242,4 +243,9 @@ def orifice_expansibility_1989(D: float, Do: float, P1: float, P2: float, k: flo
 
 def velocity_of_approach_factor(D: float, Do: float) -> float: ...
 
+
+class ReaderHarrisGallagherOrifice:
+    def __init__(self, D: float, Do: float, taps: str = ...) -> None: ...
+    def C(self, rho: float, mu: float, m: float) -> float: ...
+
 __all__: List[str]
\ No newline at end of file
@@ -635,8 +635,7 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
    'Oliphant', '_to_solve_Oliphant',
    'P_isothermal_critical_flow', 'P_upstream_isothermal_critical_flow',
    'isothermal_gas_err_P1', 'isothermal_gas_err_P2', 'isothermal_gas_err_P2_basis', 'isothermal_gas_err_D', 'isothermal_gas',
-   'v_terminal', 'differential_pressure_meter_solver', 'err_dp_meter_solver_P1', 'err_dp_meter_solver_D2',
-   'err_dp_meter_solver_P2', 'err_dp_meter_solver_m', 'V_horiz_spherical', 'V_horiz_torispherical',
+   'v_terminal', 'differential_pressure_meter_solver', '_differential_pressure_meter_solver_m_RHG', 'V_horiz_spherical', 'V_horiz_torispherical',
    'Prandtl_von_Karman_Nikuradse', 'plate_enlargement_factor', 'Stichlmair_wet', 'V_from_h',
    'SA_partial_horiz_spherical_head', '_SA_partial_horiz_spherical_head_to_int',
    '_SA_partial_horiz_ellipsoidal_head_to_int', '_SA_partial_horiz_ellipsoidal_head_limits', 'SA_partial_horiz_ellipsoidal_head',
@@ -658,7 +657,7 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
                  'optional.spa.solar_position', 'optional.spa.longitude_obliquity_nutation',
                  'optional.spa.transit_sunrise_sunset',
                  'fittings.bend_rounded_Crane', 'geometry.tank_from_two_specs_err',
-                 'friction.roughness_Farshad',
+                 'friction.roughness_Farshad', 'flow_meter.dP_venturi_tube',
                  ]
     transform_lists_to_arrays(normal_fluids, to_change, __funcs, vec=vec, cache_blacklist=cache_blacklist)
 
@@ -38,6 +38,7 @@ from fluids.flow_meter import (AS_CAST_VENTURI_TUBE, CONCENTRIC_ORIFICE, CONE_ME
                                ORIFICE_CORNER_TAPS, ORIFICE_D_AND_D_2_TAPS, ORIFICE_FLANGE_TAPS,
                                ORIFICE_PIPE_TAPS, ORIFICE_VENA_CONTRACTA_TAPS,
                                ROUGH_WELDED_CONVERGENT_VENTURI_TUBE, TAPS_OPPOSITE, TAPS_SIDE,
+                               ReaderHarrisGallagherOrifice,
                                VENTURI_NOZZLE, WEDGE_METER, cone_meter_expansibility_Stewart,
                                dP_Reader_Harris_Gallagher_wet_venturi_tube, dP_cone_meter,
                                dP_orifice, dP_venturi_tube, dP_wedge_meter,
@@ -48,7 +49,7 @@ from fluids.flow_meter import (AS_CAST_VENTURI_TUBE, CONCENTRIC_ORIFICE, CONE_ME
                                flow_coefficient, nozzle_expansibility, orifice_expansibility,
                                orifice_expansibility_1989, velocity_of_approach_factor)
 from fluids.constants import inch
-from math import log10, log, exp
+from math import log10, log, exp, pi
 from fluids.numerics import secant, linspace, logspace, assert_close, isclose, assert_close1d, assert_close2d
 import pytest
 
@@ -89,6 +90,31 @@ def test_C_Reader_Harris_Gallagher():
     C2 = C_Reader_Harris_Gallagher(D=0.07112-1e-13, **kwargs)
     assert_close(C1, C2)
 
+def test_C_Reader_Harris_Gallagher_tap_kernels():
+    # The corner and D taps kernels are specializations of the general one
+    from fluids.flow_meter import (_C_Reader_Harris_Gallagher, _C_Reader_Harris_Gallagher_corner,
+                                   _C_Reader_Harris_Gallagher_D_taps)
+    for D in (0.05, 0.07391, 0.5):
+        for beta in (0.1, 0.45, 0.75):
+            for Re_D in (100.0, 3000.0, 3700.0, 1e5, 1e8):
+                assert_close(_C_Reader_Harris_Gallagher_corner(D, beta*D, Re_D),
+                             _C_Reader_Harris_Gallagher(D, beta*D, Re_D, 0.0, 0.0), rtol=1e-14)
+                assert_close(_C_Reader_Harris_Gallagher_D_taps(D, beta*D, Re_D),
+                             _C_Reader_Harris_Gallagher(D, beta*D, Re_D, 1.0, 0.47), rtol=1e-14)
+
+def test_ReaderHarrisGallagherOrifice():
+    for taps in ('corner', 'flange', 'D', 'D/2', ORIFICE_D_AND_D_2_TAPS):
+        for D in (0.05, 0.07391, 0.5):
+            orifice = ReaderHarrisGallagherOrifice(D=D, Do=0.45*D, taps=taps)
+            for m in (1e-3, 0.12, 10.0):
+                assert_close(orifice.C(rho=1.165, mu=1.85E-5, m=m),
+                             C_Reader_Harris_Gallagher(D=D, Do=0.45*D, rho=1.165, mu=1.85E-5, m=m, taps=taps),
+                             rtol=1e-13)
+
+    with pytest.raises(ValueError):
+        ReaderHarrisGallagherOrifice(D=0.07391, Do=0.0222, taps='NOTALOCATION')
+
+
 def test_C_Miller_1996():
     C_flange_ISO = C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps='flange')
     C_corner_ISO = C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps='corner')
@@ -252,6 +278,13 @@ def test_differential_pressure_meter_diameter():
     D2 = differential_pressure_meter_solver(D=0.07366, m=8.941980099523539, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, meter_type=WEDGE_METER)
     assert_close(D2, 0.05)
 
+    # Round trip over the range of diameter ratios, including small bores
+    for meter_type in (ISO_5167_ORIFICE, LONG_RADIUS_NOZZLE, CONE_METER):
+        for beta in (0.2, 0.5, 0.75):
+            kwargs = dict(D=0.07366, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, meter_type=meter_type, taps='flange')
+            m = differential_pressure_meter_solver(D2=beta*0.07366, **kwargs)
+            assert_close(differential_pressure_meter_solver(m=m, **kwargs), beta*0.07366, rtol=1e-13)
+
 
 def test_differential_pressure_meter_P2():
     P2 = differential_pressure_meter_solver(D=0.07366, m=7.702338035732167, P1=200000.0,  D2=0.05, rho=999.1, mu=0.0011, k=1.33,  meter_type=ISO_5167_ORIFICE, taps='D')
@@ -335,6 +368,55 @@ def test_differential_pressure_meter_solver_limits():
     m_recalc = differential_pressure_meter_solver(D=0.07366, P1=200000, P2=37914.15989971644, D2=0.0345, rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
     assert_close(m_recalc, 7.702338)
 
+def test_differential_pressure_meter_solver_ISO_5167_orifice_taps():
+    # The mass flow solve uses a specialized residual; it must agree with the
+    # P2 solve, which goes through the general discharge coefficient
+    for taps in ('corner', 'flange', 'D', 'D/2', ORIFICE_D_AND_D_2_TAPS):
+        for D in (0.0254, 0.054, 0.07366):
+            kwargs = dict(D=D, D2=0.6*D, P1=200000.0, rho=999.1, mu=0.0011, k=1.33,
+                          meter_type=ISO_5167_ORIFICE, taps=taps)
+            m = differential_pressure_meter_solver(P2=183000.0, **kwargs)
+            assert_close(differential_pressure_meter_solver(m=m, **kwargs), 183000.0)
+
+def test_differential_pressure_meter_solver_m_RHG_tap_spacings():
+    # Tap spacings other than corner and D and D/2 must use the general
+    # correlation, not the specialized kernels
+    from fluids.flow_meter import _C_Reader_Harris_Gallagher, _differential_pressure_meter_solver_m_RHG
+    D, D2, mu, m_per_C = 0.07366, 0.05, 0.0011, 12.5
+    for L1, L2_prime in ((0.0, 0.0), (1.0, 0.47), (0.5, 0.0), (0.0, 0.47), (1.0, 0.3), (0.4, 0.47), (0.3448, 0.3448)):
+        m = _differential_pressure_meter_solver_m_RHG(D, D2, mu, L1, L2_prime, m_per_C)
+        Re_D = m/(0.25*pi*D*mu)
+        assert_close(m, _C_Reader_Harris_Gallagher(D, D2, Re_D, L1, L2_prime)*m_per_C, rtol=1e-13)
+
+def test_differential_pressure_meter_solver_flow_independent_C():
+    # Mass flow is computed without iterating for these meters
+    from fluids.flow_meter import _flow_independent_C_meters
+    for meter_type in _flow_independent_C_meters:
+        D2 = 0.02 if meter_type == WEDGE_METER else 0.05
+        kwargs = dict(D=0.07366, D2=D2, P1=200000.0, rho=999.1, mu=0.0011, k=1.33, meter_type=meter_type)
+        m = differential_pressure_meter_solver(P2=183000.0, **kwargs)
+        assert_close(differential_pressure_meter_solver(m=m, **kwargs), 183000.0)
+
+    m = differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33,
+                                           meter_type=LONG_RADIUS_NOZZLE, C_specified=0.9)
+    C, epsilon = differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, m=m, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33,
+                                                       meter_type=LONG_RADIUS_NOZZLE)
+    assert_close(m, flow_meter_discharge(D=0.07366, Do=0.05, P1=200000.0, P2=183000.0, rho=999.1, C=0.9, expansibility=epsilon))
+
+def test_differential_pressure_meter_solver_P_C_specified():
+    # `C` is fixed over pressure solves; only the expansibility is iterated
+    kwargs = dict(D=0.07366, D2=0.05, m=7.0, rho=999.1, mu=0.0011, k=1.33, meter_type='orifice',
+                  taps='corner', C_specified=0.61)
+    P1 = differential_pressure_meter_solver(P2=183000.0, **kwargs)
+    P2 = differential_pressure_meter_solver(P1=P1, **kwargs)
+    assert_close(P2, 183000.0)
+    epsilon = orifice_expansibility(D=0.07366, Do=0.05, P1=P1, P2=183000.0, k=1.33)
+    assert_close(flow_meter_discharge(D=0.07366, Do=0.05, P1=P1, P2=183000.0, rho=999.1, C=0.61, expansibility=epsilon), 7.0)
+
+    kwargs['meter_type'] = 'not a meter'
+    with pytest.raises(ValueError):
+        differential_pressure_meter_solver(P1=200000.0, **kwargs)
+
 def test_differential_pressure_meter_solver_misc():
     # Test for types
 
@@ -823,6 +905,11 @@ def test_differential_pressure_meter_C_epsilon():
         differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
                                               P2=183000.0, rho=999.1, mu=0.0011,
                                               k=1.33, m=7.702338035732168, meter_type='NOTAREAMETER')
+    with pytest.raises(ValueError):
+        differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
+                                              P2=183000.0, rho=999.1, mu=0.0011,
+                                              k=1.33, m=7.702338035732168, meter_type='NOTAREAMETER',
+                                              C_specified=0.6, epsilon_specified=1.0)
 
 
     C, eps = differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
@@ -131,6 +131,58 @@ def test_core_from_other_module():
 def test_string_branches():
     # Currently slower
     assert_close(fluids.numba.C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps='flange'),  0.5990326277163659)
+    for taps in ('corner', 'D'):
+        assert_close(fluids.numba.C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps=taps),
+                     fluids.C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps=taps))
+    # String-free kernel is compiled directly
+    assert_close(fluids.numba.flow_meter._C_Reader_Harris_Gallagher(0.07391, 0.0222, 111737.11091223, 0.0254/0.07391, 0.0254/0.07391),
+                 fluids.flow_meter._C_Reader_Harris_Gallagher(0.07391, 0.0222, 111737.11091223, 0.0254/0.07391, 0.0254/0.07391))
+
+@mark_as_numba
+def test_flow_meter_scalar_kernels():
+    assert_close(fluids.numba.orifice_expansibility(D=0.0739, Do=0.0222, P1=1E5, P2=9.9E4, k=1.4),
+                 fluids.orifice_expansibility(D=0.0739, Do=0.0222, P1=1E5, P2=9.9E4, k=1.4))
+    assert_close(fluids.numba.nozzle_expansibility(D=0.0739, Do=0.0222, P1=99000.0, P2=98000.0, k=1.4),
+                 fluids.nozzle_expansibility(D=0.0739, Do=0.0222, P1=99000.0, P2=98000.0, k=1.4))
+    assert_close(fluids.numba.C_ISA_1932_nozzle(D=0.07391, Do=0.0422, rho=1.2, mu=1.8E-5, m=0.1),
+                 fluids.C_ISA_1932_nozzle(D=0.07391, Do=0.0422, rho=1.2, mu=1.8E-5, m=0.1))
+    assert_close(fluids.numba.C_long_radius_nozzle(D=0.07391, Do=0.0422, rho=1.2, mu=1.8E-5, m=0.1),
+                 fluids.C_long_radius_nozzle(D=0.07391, Do=0.0422, rho=1.2, mu=1.8E-5, m=0.1))
+    assert_close(fluids.numba.discharge_coefficient_to_K(D=0.07366, Do=0.05, C=0.61512),
+                 fluids.discharge_coefficient_to_K(D=0.07366, Do=0.05, C=0.61512))
+    assert_close(fluids.numba.dP_orifice(D=0.07366, Do=0.05, P1=200000.0, P2=183000.0, C=0.61512),
+                 fluids.dP_orifice(D=0.07366, Do=0.05, P1=200000.0, P2=183000.0, C=0.61512))
+    for D, Do in ((0.07366, 0.05), (0.2, 0.02), (0.2, 0.19), (1.0, 0.5), (0.05, 0.03), (0.1, 0.1*0.74965)):
+        assert_close(fluids.numba.dP_venturi_tube(D=D, Do=Do, P1=200000.0, P2=183000.0),
+                     fluids.dP_venturi_tube(D=D, Do=Do, P1=200000.0, P2=183000.0))
+
+@mark_as_numba
+def test_flow_meter_geometry_vectorized():
+    Ds = np.array([0.0739, 0.1, 0.2])
+    Dos = np.array([0.0222, 0.05, 0.1])
+    assert_close1d(fluids.numba_vectorized.flow_meter_discharge(Ds, Dos, 1E5, 9.9E4, 1.1646, 0.5988, 0.9975),
+                   fluids.vectorized.flow_meter_discharge(Ds, Dos, 1E5, 9.9E4, 1.1646, 0.5988, 0.9975))
+    assert_close1d(fluids.numba_vectorized.velocity_of_approach_factor(Ds, Dos),
+                   fluids.vectorized.velocity_of_approach_factor(Ds, Dos))
+    assert_close1d(fluids.numba_vectorized.flow_coefficient(Ds, Dos, 0.6),
+                   fluids.vectorized.flow_coefficient(Ds, Dos, 0.6))
+    assert_close1d(fluids.numba_vectorized.orifice_expansibility(Ds, Dos, 1E5, 9.9E4, 1.4),
+                   fluids.vectorized.orifice_expansibility(Ds, Dos, 1E5, 9.9E4, 1.4))
+    assert_close1d(fluids.numba_vectorized.orifice_expansibility_1989(Ds, Dos, 1E5, 9.9E4, 1.4),
+                   fluids.vectorized.orifice_expansibility_1989(Ds, Dos, 1E5, 9.9E4, 1.4))
+
+    # Batches of orifices with taps already converted to L1, L2_prime
+    Res = np.array([1E4, 1E5, 1E7])
+    L1s = np.array([0.0, 1.0, 0.0254/0.2])
+    L2_primes = np.array([0.0, 0.47, 0.0254/0.2])
+    assert_close1d(fluids.numba_vectorized.flow_meter._C_Reader_Harris_Gallagher(Ds, Dos, Res, L1s, L2_primes),
+                   [fluids.flow_meter._C_Reader_Harris_Gallagher(*args) for args in zip(Ds, Dos, Res, L1s, L2_primes)])
+
+    # Batches of ISO 5167 orifice mass flow solves
+    mus = np.array([1.8E-5, 1E-3, 1E-3])
+    m_per_Cs = fluids.vectorized.flow_meter_discharge(Ds, Dos, 2E5, 1.83E5, 999.1, 1.0, 0.97)
+    assert_close1d(fluids.numba_vectorized.flow_meter._differential_pressure_meter_solver_m_RHG(Ds, Dos, mus, L1s, L2_primes, m_per_Cs),
+                   [fluids.flow_meter._differential_pressure_meter_solver_m_RHG(*args) for args in zip(Ds, Dos, mus, L1s, L2_primes, m_per_Cs)])
 
 @mark_as_numba
 def test_interp_with_own_list():
@@ -492,6 +544,22 @@ def test_misc_packed_tower():
                  fluids.Stichlmair_flood(Vl = 5E-3, rhog=5., rhol=1200., mug=5E-5, voidage=0.68, specific_area=260., C1=32., C2=7., C3=1.))
 
 
+@mark_as_numba
+def test_differential_pressure_meter_solver_all_meters():
+    # The residuals are compiled along with the solver; check every meter type
+    for meter_type in sorted(fluids.flow_meter.all_meters):
+        kwargs = dict(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33,
+                      meter_type=meter_type, taps='flange', tap_position='180 degree')
+        if meter_type == 'unspecified meter':
+            kwargs['C_specified'] = 0.6
+        elif 'wedge' in meter_type:
+            kwargs['D2'] = 0.02
+        elif 'cone' in meter_type:
+            kwargs['D2'] = 0.04
+        assert_close(fluids.numba.differential_pressure_meter_solver(**kwargs),
+                     fluids.differential_pressure_meter_solver(**kwargs), rtol=1e-13)
+
+
 @mark_as_numba
 def test_misc_flow_meter():
     assert_close(fluids.numba.differential_pressure_meter_beta(D=0.2575, D2=0.184, meter_type='cone meter'),